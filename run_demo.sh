@@ -9,6 +9,7 @@ echo ""
 # Parse command line arguments
 DEBUG_MODE=false
 PREDICT_MODE=""
+THREADS=1
 
 while [[ $# -gt 0 ]]; do
     case $1 in
@@ -20,6 +21,10 @@ while [[ $# -gt 0 ]]; do
             PREDICT_MODE="predict"
             shift
             ;;
+        --threads)
+            THREADS="$2"
+            shift 2
+            ;;
         --cot|--chain-of-thought)
             PREDICT_MODE="cot"
             shift
@@ -32,6 +37,7 @@ while [[ $# -gt 0 ]]; do
             echo "  --predict            Use Predict mode (direct prediction)"
             echo "  --cot                Use Chain of Thought mode (default)"
             echo "  --chain-of-thought   Same as --cot"
+            echo "  --threads N          Send N test cases to the LLM at once (default: 1)"
             echo "  -h, --help           Show this help message"
             echo ""
             echo "Examples:"
@@ -39,6 +45,7 @@ while [[ $# -gt 0 ]]; do
             echo "  ./run_demo.sh --debug            # Chain of Thought with debug output"
             echo "  ./run_demo.sh --predict          # Predict mode"
             echo "  ./run_demo.sh --predict --debug  # Predict mode with debug output"
+            echo "  ./run_demo.sh --threads 4        # Run 4 test cases concurrently"
             exit 0
             ;;
         *)
@@ -88,7 +95,7 @@ fi
 # Run the demo
 echo "🚀 Running demo..."
 echo ""
-poetry run python -m tool_selection.multi_demo
+poetry run python -m tool_selection.multi_demo --threads "$THREADS"
 
 if [ "$DEBUG_MODE" = true ]; then
     echo ""
@@ -13,6 +13,9 @@ show_usage() {
     echo ""
     echo "Options:"
     echo "  --models \"model1,model2\"  Comma-separated list of models to test"
+    echo "  --ollama-urls \"url1,url2\" Comma-separated Ollama servers (e.g. one per GPU)"
+    echo "  --force                   Re-run models even if cached results exist"
+    echo "  --threads N               Send N test cases to each model at once (default: 1)"
     echo "  --create-md               Run csv_to_md.py to convert CSV to markdown"
     echo "  --csv input.csv          CSV file to convert (required with --create-md)"
     echo "  -o output.md             Output markdown file (required with --create-md)"
@@ -22,6 +25,9 @@ show_usage() {
     echo "  # Run model comparison with specific models"
     echo "  ./run_model_comparison.sh --models \"gemma3:27b,llama3.1:8b\""
     echo ""
+    echo "  # Spread models across two Ollama servers (one per GPU)"
+    echo "  ./run_model_comparison.sh --models \"gemma3:27b,llama3.1:8b\" --ollama-urls \"http://localhost:11434,http://localhost:11435\""
+    echo ""
     echo "  # Convert CSV to markdown"
     echo "  ./run_model_comparison.sh --create-md --csv input.csv -o output.md"
     exit 0
@@ -34,6 +40,18 @@ while [[ $# -gt 0 ]]; do
             MODELS="$2"
             shift 2
             ;;
+        --ollama-urls)
+            OLLAMA_URLS="$2"
+            shift 2
+            ;;
+        --force)
+            FORCE=true
+            shift
+            ;;
+        --threads)
+            THREADS="$2"
+            shift 2
+            ;;
         --create-md)
             CREATE_MD=true
             shift
@@ -97,6 +115,18 @@ if [ ! -z "$MODELS" ]; then
     CMD="$CMD --models \"$MODELS\""
 fi
 
+if [ ! -z "$OLLAMA_URLS" ]; then
+    CMD="$CMD --ollama-urls \"$OLLAMA_URLS\""
+fi
+
+if [ "$FORCE" = true ]; then
+    CMD="$CMD --force"
+fi
+
+if [ ! -z "$THREADS" ]; then
+    CMD="$CMD --threads \"$THREADS\""
+fi
+
 # Run the comparison
 echo "🚀 Running model comparison..."
 echo ""
@@ -5,7 +5,7 @@ from .models import TestCase, TestResult, TestSummary, ToolSelectionEvaluation,
 from .console import ConsoleFormatter
 from .llm_factory import setup_llm
 
-__all__ = [
+__all__ = (
     "ToolSelectionMetrics",
     "evaluate_tool_selection",
     "TestCase",
@@ -15,4 +15,4 @@ __all__ = [
     "ModelComparisonResult",
     "ConsoleFormatter",
     "setup_llm",
-]
\ No newline at end of file
+)
\ No newline at end of file
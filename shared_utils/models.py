@@ -1,14 +1,20 @@
 """Pydantic models for test results and evaluation data."""
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TestCase(BaseModel):
-    """Definition of a test case for tool selection."""
+    """Definition of a test case for tool selection.
+    
+    Frozen, with the expected tools held in a tuple, so the cached test case
+    sets can be shared safely.
+    """
+    model_config = ConfigDict(frozen=True)
+    
     request: str = Field(description="The user request to test")
-    expected_tools: List[str] = Field(description="Expected tools to be selected")
+    expected_tools: Tuple[str, ...] = Field(description="Expected tools to be selected")
     description: str = Field(description="Description of what this test validates")
     category: str = Field(default="general", description="Category of the test")
 
@@ -2,36 +2,52 @@
 
 import pytest
 import os
-import sys
-from pathlib import Path
 
-# Add parent directory to path so we can import our modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Set up the environment at import, before any test module is collected
+# Use a smaller model for faster tests
+os.environ.setdefault("OLLAMA_MODEL", "gemma2:2b")
+os.environ["DSPY_DEBUG"] = "false"  # Disable debug output during tests
 
 
-@pytest.fixture(autouse=True)
-def setup_environment():
-    """Set up environment variables for testing."""
-    # Use a smaller model for faster tests
-    os.environ["OLLAMA_MODEL"] = os.environ.get("OLLAMA_MODEL", "gemma2:2b")
-    os.environ["DSPY_DEBUG"] = "false"  # Disable debug output during tests
-    
-    yield
+@pytest.fixture(scope="session")
+def llm():
+    """Setup LLM once for the whole test session."""
+    from shared_utils.llm_factory import setup_llm
+    return setup_llm()
+
+
+@pytest.fixture(scope="session")
+def full_registry():
+    """Create a registry with all tools registered, shared by the session.
     
-    # Cleanup if needed
-    pass
+    Tests must not register tools on it; use an empty registry for that.
+    """
+    from tool_selection.tool_registry import MultiToolRegistry
+    registry = MultiToolRegistry()
+    registry.register_all_tools()
+    return registry
+
+
+@pytest.fixture(scope="session")
+def tool_definitions(full_registry):
+    """All tool definitions, read once from the shared registry."""
+    return full_registry.get_tool_definitions()
 
 
 @pytest.fixture
-def quiet_mode(monkeypatch):
-    """Fixture to suppress stdout during tests."""
-    import io
-    import contextlib
+def mock_llm():
+    """Answer LLM calls with a canned search_products selection.
     
-    @contextlib.contextmanager
-    def suppress_output():
-        with contextlib.redirect_stdout(io.StringIO()):
-            with contextlib.redirect_stderr(io.StringIO()):
-                yield
+    For tests that check the plumbing rather than the model's tool choice,
+    so they don't wait on real generations.
+    """
+    import dspy
+    from dspy.utils.dummies import DummyLM
     
-    return suppress_output
\ No newline at end of file
+    answer = {
+        "reasoning": "The user wants to search for products.",
+        "tool_calls": [{"tool_name": "search_products", "arguments": {"query": "laptops"}}]
+    }
+    lm = DummyLM([answer] * 10)
+    with dspy.context(lm=lm):
+        yield lm
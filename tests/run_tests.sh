@@ -12,13 +12,21 @@ if ! poetry run python -c "import pytest" 2>/dev/null; then
     echo
 fi
 
+# Run test files in parallel if pytest-xdist is available; the tests spend
+# most of their time waiting on the LLM, so their requests overlap
+PARALLEL_ARGS=""
+if poetry run python -c "import xdist" 2>/dev/null; then
+    echo "⚡ Running tests in parallel (pytest-xdist)..."
+    PARALLEL_ARGS="-n auto --dist loadfile"
+fi
+
 # Run tests with coverage if available
 if poetry run python -c "import pytest_cov" 2>/dev/null; then
     echo "📊 Running tests with coverage..."
-    poetry run pytest -v --cov=. --cov-report=term-missing tests/ integration_tests/
+    poetry run pytest -v $PARALLEL_ARGS --cov=. --cov-report=term-missing tests/ integration_tests/
 else
     echo "🧪 Running tests..."
-    poetry run pytest -v tests/ integration_tests/
+    poetry run pytest -v $PARALLEL_ARGS tests/ integration_tests/
 fi
 
 echo
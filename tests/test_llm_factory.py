@@ -0,0 +1,31 @@
+"""Tests for the LLM factory."""
+
+import pytest
+import dspy
+from shared_utils import llm_factory
+from shared_utils.llm_factory import setup_llm
+
+
+@pytest.fixture
+def no_connection_test(monkeypatch):
+    """Answer the connection test without a server, starting from an empty LM cache."""
+    monkeypatch.setattr(dspy.LM, "__call__", lambda self, *args, **kwargs: ["Hello"])
+    llm_factory._create_llm.cache_clear()
+    yield
+    llm_factory._create_llm.cache_clear()
+
+
+def test_setup_llm_follows_model_env_var(monkeypatch, no_connection_test):
+    """Test that changing OLLAMA_MODEL between calls changes the LM."""
+    monkeypatch.setenv("DSPY_PROVIDER", "ollama")
+    monkeypatch.setenv("OLLAMA_MODEL", "first:1")
+    first = setup_llm(configure=False)
+
+    monkeypatch.setenv("OLLAMA_MODEL", "second:2")
+    second = setup_llm(configure=False)
+
+    assert first.model == "ollama/first:1"
+    assert second.model == "ollama/second:2"
+
+    # The same settings again reuse the cached LM
+    assert setup_llm(configure=False) is second
@@ -1,9 +1,27 @@
 """Tests for the tool registry."""
 
 import pytest
+from pydantic import ValidationError
 from tool_selection.tool_registry import MultiToolRegistry
 from tool_selection.models import MultiTool, MultiToolName, MultiToolDecision, ToolCall, ToolArgument
 
+# Every tool register_all_tools implements (MultiToolName also lists unimplemented ones)
+EXPECTED_TOOLS = frozenset({
+    "find_events", "create_event", "cancel_event",
+    "search_products", "add_to_cart", "track_order", "return_item",
+    "check_balance", "transfer_money", "pay_bill", "get_statement", "invest"
+})
+
+# Tool definitions are frozen, so every test can share the same one
+SAMPLE_TOOL = MultiTool(
+    name=MultiToolName.CHECK_BALANCE,
+    description="Check account balance",
+    category="finance",
+    arguments=[
+        ToolArgument(name="account_type", type="str", description="Account type")
+    ]
+)
+
 
 @pytest.fixture
 def registry():
@@ -13,15 +31,8 @@ def registry():
 
 @pytest.fixture
 def sample_tool():
-    """Create a sample tool."""
-    return MultiTool(
-        name=MultiToolName.CHECK_BALANCE,
-        description="Check account balance",
-        category="finance",
-        arguments=[
-            ToolArgument(name="account_type", type="str", description="Account type")
-        ]
-    )
+    """A sample tool."""
+    return SAMPLE_TOOL
 
 
 def test_register_tool(registry, sample_tool):
@@ -44,6 +55,41 @@ def test_get_tool_definitions(registry, sample_tool):
     assert tools[0].name == MultiToolName.CHECK_BALANCE
 
 
+def test_get_tool_definitions_refreshed_on_register(registry, sample_tool):
+    """Test that definitions and names are reused until another tool is registered."""
+    registry.register(sample_tool, lambda args: {"result": "ok"})
+    tools = registry.get_tool_definitions()
+    assert registry.get_tool_definitions() is tools
+    assert registry.get_tool_names() == ("check_balance",)
+
+    registry.register(
+        MultiTool(name=MultiToolName.PAY_BILL, description="Pay a bill", arguments=[], category="finance"),
+        lambda args: {"result": "paid"}
+    )
+    assert len(registry.get_tool_definitions()) == 2
+    assert registry.get_tool_names() == ("check_balance", "pay_bill")
+
+
+def test_tool_definitions_are_frozen(tool_definitions):
+    """Test that the shared tool definitions can't be changed by a caller."""
+    tool = tool_definitions[0]
+    
+    with pytest.raises(ValidationError, match="frozen"):
+        tool.description = "Changed"
+    with pytest.raises(ValidationError, match="frozen"):
+        tool.arguments[0].name = "changed"
+    # The argument list itself is a tuple, so it can't be cleared or appended to
+    assert isinstance(tool.arguments, tuple)
+    with pytest.raises(AttributeError):
+        tool.arguments.clear()
+    
+    # Later registries still see the full definitions
+    registry = MultiToolRegistry()
+    registry.register_all_tools()
+    assert registry.get_tool_definitions()[0].arguments == tool.arguments
+    assert tool.arguments
+
+
 def test_execute_single_tool(registry, sample_tool):
     """Test executing a single tool."""
     def check_balance_func(args):
@@ -107,6 +153,32 @@ def test_execute_multiple_tools(registry):
     assert results[1]["tool"] == "find_events"
 
 
+def test_execute_duplicate_tool_calls(registry, sample_tool):
+    """Test that identical tool calls are each executed, since tools can have side effects."""
+    calls = []
+    
+    def check_balance_func(args):
+        calls.append(args)
+        return {"balance": 1000, "account": args.get("account_type", "checking")}
+    
+    registry.register(sample_tool, check_balance_func)
+    
+    decision = MultiToolDecision(
+        tool_calls=[
+            ToolCall(tool_name="check_balance", arguments={"account_type": "savings"}),
+            ToolCall(tool_name="check_balance", arguments={"account_type": "savings"}),
+            ToolCall(tool_name="check_balance", arguments={"account_type": "checking"})
+        ],
+        reasoning="Repeated balance checks"
+    )
+    
+    results = registry.execute(decision)
+    
+    assert len(results) == 3
+    assert calls == [{"account_type": "savings"}, {"account_type": "savings"}, {"account_type": "checking"}]
+    assert results[2]["result"]["account"] == "checking"
+
+
 def test_execute_missing_tool(registry):
     """Test executing a tool that's not registered."""
     decision = MultiToolDecision(
@@ -157,11 +229,5 @@ def test_register_all_tools():
     registry = MultiToolRegistry()
     registry.register_all_tools()
     
-    # Should have registered all tools from MultiToolName enum
-    tool_names = registry.get_tool_names()
-    assert len(tool_names) > 10  # Should have many tools
-    
-    # Check a few specific tools
-    assert "find_events" in tool_names
-    assert "check_balance" in tool_names
-    assert "search_products" in tool_names
\ No newline at end of file
+    # Should have registered every implemented tool, and nothing else
+    assert set(registry.get_tool_names()) == EXPECTED_TOOLS
\ No newline at end of file
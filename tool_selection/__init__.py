@@ -9,11 +9,11 @@ from .models import (
     ToolCall
 )
 
-__all__ = [
+__all__ = (
     'MultiToolSelector',
     'MultiToolRegistry',
     'MultiToolName',
     'MultiTool',
     'MultiToolDecision',
     'ToolCall'
-]
\ No newline at end of file
+)
\ No newline at end of file
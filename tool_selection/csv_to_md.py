@@ -54,7 +54,9 @@ def generate_markdown_summary(csv_path: str) -> str:
     for idx, row in success_df.iterrows():
         rank = len(success_df[success_df['avg_f1'] > row['avg_f1']]) + 1
         perfect_str = f"{int(row['perfect_matches'])}/{int(row['total_tests'])} ({row['perfect_match_pct']:.1f}%)"
-        md.append(f"| {rank} | {row['model']} | {row['mode']} | {row['avg_f1']:.3f} | {row['avg_precision']:.3f} | {row['avg_recall']:.3f} | {perfect_str} | {row['runtime']:.1f}s |")
+        # Cached rows carry the runtime of the earlier run they were reused from
+        runtime_str = f"{row['runtime']:.1f}s" + (" (cached)" if str(row.get('cached')) == 'True' else "")
+        md.append(f"| {rank} | {row['model']} | {row['mode']} | {row['avg_f1']:.3f} | {row['avg_precision']:.3f} | {row['avg_recall']:.3f} | {perfect_str} | {runtime_str} |")
     
     md.append("")
     
@@ -5,8 +5,8 @@ the tool selector and tool registry modules, avoiding circular imports.
 """
 
 from enum import Enum
-from typing import List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import List, Dict, Any, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ToolArgument(BaseModel):
@@ -15,6 +15,8 @@ class ToolArgument(BaseModel):
     DSPy will use the Field descriptions to help the LLM understand
     what each field represents when generating structured output.
     """
+    model_config = ConfigDict(frozen=True)
+    
     name: str = Field(description="Argument name")
     type: str = Field(description="Argument type (str, int, etc.)")
     description: str = Field(description="What this argument is for")
@@ -44,10 +46,16 @@ class MultiToolName(str, Enum):
 
 
 class MultiTool(BaseModel):
-    """Extended tool definition."""
+    """Extended tool definition.
+    
+    Frozen, with the arguments held in a tuple, so one set of definitions
+    can be shared by every request and thread without being copied.
+    """
+    model_config = ConfigDict(frozen=True)
+    
     name: MultiToolName
     description: str
-    arguments: List[ToolArgument]
+    arguments: Tuple[ToolArgument, ...]
     category: str
 
 
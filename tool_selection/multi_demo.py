@@ -14,6 +14,9 @@ import json
 from datetime import datetime
 from typing import Dict, List, Set, Any
 import time
+import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append(str(Path(__file__).parent.parent))
 sys.path.append(str(Path(__file__).parent.parent / "tools"))
@@ -39,17 +42,31 @@ from shared_utils import (
 from .test_cases import get_multi_tool_test_cases
 
 
-def run_demo(verbose=True, predict=False):
+def run_demo(verbose=True, predict=False, model=None, base_url=None, num_threads=1, debug=None,
+             test_cases=None):
     """Run the multi-tool demo and return results as a dictionary.
     
+    The LLM is only activated for this run (via `dspy.context`), so several
+    demos can run side by side in different threads.
+    
+    With `num_threads` > 1 the test cases are sent to the LLM concurrently.
+    Ollama decodes them in parallel when started with OLLAMA_NUM_PARALLEL set
+    (each slot needs its own KV cache, so keep it within the free VRAM);
+    otherwise it queues them and nothing is lost.
+    
     Args:
         verbose: If True, print progress to console. If False, run quietly.
         predict: If True, use dspy.Predict instead of dspy.ChainOfThought
+        model: Model to use instead of the configured default
+        base_url: Ollama server URL to use instead of OLLAMA_BASE_URL
+        num_threads: Number of test cases to send to the LLM at once
+        debug: If True, show the DSPy execution history. Defaults to DSPY_DEBUG.
+        test_cases: Test cases to run. Defaults to the multi-tool test cases.
         
     Returns:
         Dictionary containing summary and detailed results
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     formatter = ConsoleFormatter()
     metrics = ToolSelectionMetrics()
     
@@ -61,13 +78,13 @@ def run_demo(verbose=True, predict=False):
     # Setup
     try:
         if verbose:
-            setup_llm()
+            llm = setup_llm(model=model, base_url=base_url, configure=False, debug=debug)
         else:
             # Suppress output
             import io
             import contextlib
             with contextlib.redirect_stdout(io.StringIO()):
-                setup_llm()
+                llm = setup_llm(model=model, base_url=base_url, configure=False, debug=debug)
     except Exception as e:
         if verbose:
             print(formatter.error_message(f"Failed to setup Ollama: {e}"))
@@ -78,130 +95,161 @@ def run_demo(verbose=True, predict=False):
     registry.register_all_tools()
     selector = MultiToolSelector(use_predict=predict)
     
-    # Get test cases from shared module
-    test_cases = get_multi_tool_test_cases()
+    # The tool definitions are the same for every test case, so get them once
+    # and build the selector's signature before the first timed request
+    tool_definitions = registry.get_tool_definitions()
+    selector.prepare(tool_definitions)
+    
+    # Get test cases from shared module unless the caller built them already
+    if test_cases is None:
+        test_cases = get_multi_tool_test_cases()
     
     # Track results
     test_results = []
     evaluations = []
     
+    def select_tools(test_case):
+        """Get the LLM's decision for a test case and the time the request started."""
+        selection_start = time.perf_counter()
+        try:
+            # dspy.context is per thread, so it's entered in the worker
+            with dspy.context(lm=llm):
+                decision = selector(test_case.request, tool_definitions)
+            return decision, None, selection_start
+        except Exception as e:
+            return None, e, selection_start
+    
+    # With one thread each request is sent when the loop reaches its test case.
+    # With more, they are all sent up front and reported in test case order.
+    executor = ThreadPoolExecutor(max_workers=num_threads) if num_threads > 1 else None
+    if executor:
+        selections = [executor.submit(select_tools, test_case).result for test_case in test_cases]
+    else:
+        selections = [functools.partial(select_tools, test_case) for test_case in test_cases]
+    
     if verbose:
         print(formatter.section_separator())
     
-    for i, test_case in enumerate(test_cases, 1):
-        test_start = time.time()
+    try:
+        for i, (test_case, get_selection) in enumerate(zip(test_cases, selections), 1):
+            decision, selection_error, test_start = get_selection()
         
-        if verbose:
-            print(formatter.test_progress(i, len(test_cases), test_case.description))
-            print(f"👤 User: {test_case.request}")
-            print(f"🎯 Expected tools: {test_case.expected_tools}")
+            if verbose:
+                print(formatter.test_progress(i, len(test_cases), test_case.description))
+                print(f"👤 User: {test_case.request}")
+                print(f"🎯 Expected tools: {list(test_case.expected_tools)}")
         
-        try:
-            # Get LLM's decision
-            decision = selector(test_case.request, registry.get_tool_definitions())
+            try:
+                # Get LLM's decision
+                if selection_error is not None:
+                    raise selection_error
             
-            # Extract actual tools selected
-            actual_tools = [tc.tool_name for tc in decision.tool_calls]
+                # Extract actual tools selected
+                actual_tools = [tc.tool_name for tc in decision.tool_calls]
             
-            if verbose:
-                print(f"\n🤖 Selected tools: {actual_tools}")
-                print(f"   Reasoning: {decision.reasoning}")
+                if verbose:
+                    print(f"\n🤖 Selected tools: {actual_tools}")
+                    print(f"   Reasoning: {decision.reasoning}")
             
-            # Evaluate selection using shared metrics
-            expected_set = set(test_case.expected_tools)
-            actual_set = set(actual_tools)
-            evaluation = metrics.evaluate_selection(expected_set, actual_set)
+                # Evaluate selection using shared metrics
+                expected_set = set(test_case.expected_tools)
+                actual_set = set(actual_tools)
+                evaluation = metrics.evaluate_selection(expected_set, actual_set)
             
-            # Create evaluation object
-            eval_obj = ToolSelectionEvaluation(**evaluation)
+                # Create evaluation object
+                eval_obj = ToolSelectionEvaluation(**evaluation)
             
-            if verbose:
-                print(f"\n📊 Evaluation:")
-                comparison_lines = formatter.format_tool_comparison(
-                    test_case.expected_tools, 
-                    actual_tools
-                )
-                for line in comparison_lines:
-                    print(f"   {line}")
+                if verbose:
+                    print(f"\n📊 Evaluation:")
+                    comparison_lines = formatter.format_tool_comparison(
+                        test_case.expected_tools, 
+                        actual_tools
+                    )
+                    for line in comparison_lines:
+                        print(f"   {line}")
                 
-                metric_lines = formatter.format_metrics_summary(evaluation)
-                for line in metric_lines:
-                    print(f"   {line}")
+                    metric_lines = formatter.format_metrics_summary(evaluation)
+                    for line in metric_lines:
+                        print(f"   {line}")
             
-            # Execute tools and collect results
-            execution_results = []
-            execution_error = None
+                # Execute tools and collect results
+                execution_results = []
+                execution_error = None
             
-            try:
-                results = registry.execute(decision)
-                execution_results = results
+                try:
+                    results = registry.execute(decision)
+                    execution_results = results
                 
-                if verbose:
-                    print(f"\n🔧 Execution results:")
-                    for result in results:
-                        if 'error' in result:
-                            error_msg = f"{result['tool']}: {result['error']}"
-                            print(f"   {formatter.error_message(error_msg)}")
-                        else:
-                            success_msg = f"{result['tool']}: {result['result']}"
-                            print(f"   {formatter.success_message(success_msg)}")
-            except Exception as e:
-                execution_error = str(e)
-                if verbose:
-                    error_msg = f'Execution error: {e}'
-                    print(f"   {formatter.error_message(error_msg)}")
+                    if verbose:
+                        print(f"\n🔧 Execution results:")
+                        for result in results:
+                            if 'error' in result:
+                                error_msg = f"{result['tool']}: {result['error']}"
+                                print(f"   {formatter.error_message(error_msg)}")
+                            else:
+                                success_msg = f"{result['tool']}: {result['result']}"
+                                print(f"   {formatter.success_message(success_msg)}")
+                except Exception as e:
+                    execution_error = str(e)
+                    if verbose:
+                        error_msg = f'Execution error: {e}'
+                        print(f"   {formatter.error_message(error_msg)}")
             
-            # Create test result
-            test_result = TestResult(
-                test_case=test_case,
-                actual_tools=actual_tools,
-                reasoning=decision.reasoning,
-                evaluation=eval_obj,
-                execution_results=execution_results if execution_results else None,
-                error=execution_error,
-                duration_ms=(time.time() - test_start) * 1000
-            )
+                # Create test result
+                test_result = TestResult(
+                    test_case=test_case,
+                    actual_tools=actual_tools,
+                    reasoning=decision.reasoning,
+                    evaluation=eval_obj,
+                    execution_results=execution_results if execution_results else None,
+                    error=execution_error,
+                    duration_ms=(time.perf_counter() - test_start) * 1000
+                )
             
-            test_results.append(test_result)
-            evaluations.append(evaluation)
+                test_results.append(test_result)
+                evaluations.append(evaluation)
                 
-        except Exception as e:
-            # Handle selection error
-            error_result = TestResult(
-                test_case=test_case,
-                actual_tools=[],
-                reasoning="",
-                evaluation=ToolSelectionEvaluation(
-                    precision=0.0,
-                    recall=0.0,
-                    f1_score=0.0,
-                    is_perfect_match=False
-                ),
-                error=str(e),
-                duration_ms=(time.time() - test_start) * 1000
-            )
-            test_results.append(error_result)
+            except Exception as e:
+                # Handle selection error
+                error_result = TestResult(
+                    test_case=test_case,
+                    actual_tools=[],
+                    reasoning="",
+                    evaluation=ToolSelectionEvaluation(
+                        precision=0.0,
+                        recall=0.0,
+                        f1_score=0.0,
+                        is_perfect_match=False
+                    ),
+                    error=str(e),
+                    duration_ms=(time.perf_counter() - test_start) * 1000
+                )
+                test_results.append(error_result)
             
-            if verbose:
-                error_msg = f'Selection error: {e}'
-                print(f"   {formatter.error_message(error_msg)}")
+                if verbose:
+                    error_msg = f'Selection error: {e}'
+                    print(f"   {formatter.error_message(error_msg)}")
             
-        if verbose:
-            print(f"\n{formatter.section_separator()}\n")
+            if verbose:
+                print(f"\n{formatter.section_separator()}\n")
+    finally:
+        # Don't leave requests running if the loop fails part-way
+        if executor:
+            executor.shutdown(cancel_futures=True)
     
     # Calculate summary statistics
     aggregate_metrics = metrics.aggregate_metrics(evaluations)
     
     # Create summary
     summary = TestSummary(
-        model=os.getenv("OLLAMA_MODEL", "unknown"),
+        model=model or os.getenv("OLLAMA_MODEL", "unknown"),
         total_tests=len(test_cases),
         passed_tests=sum(1 for r in test_results if r.error is None),
         perfect_matches=aggregate_metrics["perfect_matches"],
         avg_precision=aggregate_metrics["avg_precision"],
         avg_recall=aggregate_metrics["avg_recall"],
         avg_f1_score=aggregate_metrics["avg_f1_score"],
-        total_duration_seconds=time.time() - start_time
+        total_duration_seconds=time.perf_counter() - start_time
     )
     
     if verbose:
@@ -229,7 +277,8 @@ def run_demo(verbose=True, predict=False):
         print(f"F1 Score:  {formatter.performance_bar(summary.avg_f1_score)}")
         
         # Show debug history if enabled
-        debug = os.getenv("DSPY_DEBUG", "false").lower() == "true"
+        if debug is None:
+            debug = os.getenv("DSPY_DEBUG", "false").lower() == "true"
         if debug:
             print(f"\n{formatter.section_header('🔍 DSPy Execution History (last 3 calls)')}")
             dspy.inspect_history(n=3)
@@ -248,17 +297,17 @@ def run_demo(verbose=True, predict=False):
 
 def main():
     """Main function for command-line usage."""
-    import argparse
-    
     parser = argparse.ArgumentParser(description="Run multi-tool selection demo")
     parser.add_argument("--predict", action="store_true", 
                         help="Use dspy.Predict instead of dspy.ChainOfThought")
     parser.add_argument("--quiet", action="store_true",
                         help="Run in quiet mode without verbose output")
+    parser.add_argument("--threads", type=int, default=1,
+                        help="Number of test cases to send to the LLM at once (default: 1)")
     
     args = parser.parse_args()
     
-    results = run_demo(verbose=not args.quiet, predict=args.predict)
+    results = run_demo(verbose=not args.quiet, predict=args.predict, num_threads=args.threads)
     
     # Optionally save to file when run standalone
     if 'error' not in results:
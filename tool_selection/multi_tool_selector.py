@@ -7,17 +7,32 @@ parsing and provide robust multi-tool selection.
 
 __all__ = ['MultiToolSelector']
 
+import functools
+
 import dspy
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import List, Dict, Any, Literal, Optional
 
 # Import shared models from the new module
 from .models import MultiTool, MultiToolDecision, ToolCall
 
+# Converts the LLM's DynamicToolCall list to ToolCalls in one validation pass
+_TOOL_CALLS_ADAPTER = TypeAdapter(List[ToolCall])
+
+# Version of the prompt the selector sends. Bump it whenever the signature,
+# the tools description or the model field descriptions change, so cached
+# model comparison results are re-run.
+PROMPT_VERSION = 1
+
 
 # Step 2: Dynamic Signature Factory
+@functools.lru_cache(maxsize=None)
 def create_multi_tool_signature(tool_names: tuple[str, ...]):
-    """Create a signature with dynamic Literal types for multi-tool selection."""
+    """Create a signature with dynamic Literal types for multi-tool selection.
+    
+    Cached per tool set, so every selector for the same tools shares one
+    signature class instead of rebuilding the Pydantic models each time.
+    """
     
     # Dynamic ToolCall with Literal constraint
     class DynamicToolCall(BaseModel):
@@ -40,9 +55,10 @@ def create_multi_tool_signature(tool_names: tuple[str, ...]):
         - Extract all required arguments from the user's request
         - If arguments are missing, note it in the reasoning
         """
-        # Inputs
-        user_request: str = dspy.InputField(desc="What the user wants to do")
+        # Inputs - the tool list is the same for every request, so it goes
+        # first to keep the prompt prefix identical and cacheable by the server
         available_tools: str = dspy.InputField(desc="Available tools with descriptions")
+        user_request: str = dspy.InputField(desc="What the user wants to do")
         
         # Outputs (properly typed!)
         tool_calls: List[DynamicToolCall] = dspy.OutputField(
@@ -69,32 +85,64 @@ class MultiToolSelector(dspy.Module):
         self._use_predict = use_predict
         self._signature_class = None
         self._selector = None
+        self._tool_names = None
+        self._tools_description = None
     
     def _ensure_initialized(self, tool_names: tuple[str, ...]):
-        """Lazy initialization with tool names."""
-        if self._selector is None:
+        """Lazy initialization with tool names, redone if the tool set changes.
+        
+        Raises:
+            ValueError: If the tool set changes after demos were loaded or
+                compiled into the selector, since rebuilding it would drop them
+        """
+        if self._selector is not None and self._tool_names != tool_names:
+            if any(predictor.demos for predictor in self._selector.predictors()):
+                raise ValueError(
+                    f"Selector has demos for tools {self._tool_names}; "
+                    f"create a new selector for tools {tool_names}"
+                )
+        if self._selector is None or self._tool_names != tool_names:
+            self._tool_names = tool_names
             self._signature_class = create_multi_tool_signature(tool_names)
             if self._use_predict:
                 self._selector = dspy.Predict(self._signature_class)
             else:
                 self._selector = dspy.ChainOfThought(self._signature_class)
     
-    def forward(self, user_request: str, available_tools: List[MultiTool]) -> MultiToolDecision:
-        """Select multiple tools based on user request.
+    def prepare(self, available_tools: List[MultiTool]) -> str:
+        """Build the signature and tools description ahead of the first request.
+        
+        Called automatically by `forward`; call it up front to keep the setup
+        out of the first request's timing and before requests run in threads.
         
         Args:
-            user_request: What the user wants to do
             available_tools: List of available MultiTool objects
             
         Returns:
-            MultiToolDecision with type-safe tool calls
+            The formatted tools description used in the prompt
         """
         # Extract tool names for dynamic signature
         tool_names = tuple(tool.name.value for tool in available_tools)
         self._ensure_initialized(tool_names)
         
-        # Format tools for the prompt
-        tools_description = self._format_tools(available_tools)
+        # Format tools for the prompt once per tool set, keyed like the
+        # signature; every request sees the same text, which also lets the
+        # server reuse the cached prompt prefix
+        if self._tools_description is None or self._tools_description[0] != tool_names:
+            self._tools_description = (tool_names, self._format_tools(available_tools))
+        return self._tools_description[1]
+    
+    def forward(self, user_request: str, available_tools: List[MultiTool]) -> MultiToolDecision:
+        """Select multiple tools based on user request.
+        
+        Args:
+            user_request: What the user wants to do
+            available_tools: List of available MultiTool objects
+            
+        Returns:
+            MultiToolDecision with type-safe tool calls
+        """
+        tools_description = self.prepare(available_tools)
         
         # Let DSPy handle everything - no manual parsing!
         result = self._selector(
@@ -103,13 +151,7 @@ class MultiToolSelector(dspy.Module):
         )
         
         # Convert DynamicToolCall instances to ToolCall instances
-        tool_calls = [
-            ToolCall(
-                tool_name=tc.tool_name,
-                arguments=tc.arguments
-            )
-            for tc in result.tool_calls
-        ]
+        tool_calls = _TOOL_CALLS_ADAPTER.validate_python(result.tool_calls, from_attributes=True)
         
         # Return the decision model
         return MultiToolDecision(
@@ -1,68 +1,100 @@
 #!/usr/bin/env poetry run python3
 """Run the multi-tool demo with multiple Ollama models and compare results."""
 
-import subprocess
 import sys
 import os
 import json
-import pandas as pd
+import hashlib
+import functools
+from operator import itemgetter
+import queue
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import time
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 import argparse
 from pathlib import Path
 
 # Add the parent directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from tool_selection.multi_tool_selector import PROMPT_VERSION
 from tool_selection.multi_demo import run_demo
-from shared_utils import ConsoleFormatter, TestSummary, ModelComparisonResult
+from tool_selection.tool_registry import MultiToolRegistry
+from tool_selection.test_cases import get_multi_tool_test_cases
+from shared_utils import ConsoleFormatter, TestCase, TestSummary, ModelComparisonResult
 
-def check_prerequisites():
+DEFAULT_OLLAMA_URL = "http://localhost:11434"
+RESULTS_DIR = Path("model_test_results")
+CACHE_DIR = RESULTS_DIR / "cache"
+
+
+def get_ollama_endpoints(urls: Optional[str] = None) -> List[str]:
+    """Get the Ollama server URLs to spread the models across.
+    
+    On a multi-GPU machine, start one Ollama server per GPU and pass all of
+    their URLs so each model can be served by its own device, e.g.:
+    
+        CUDA_VISIBLE_DEVICES=1 OLLAMA_HOST=127.0.0.1:11435 ollama serve
+    
+    Args:
+        urls: Comma-separated server URLs. Defaults to OLLAMA_BASE_URL.
+    """
+    if urls:
+        return [u.strip().rstrip('/') for u in urls.split(',') if u.strip()]
+    return [os.getenv("OLLAMA_BASE_URL", DEFAULT_OLLAMA_URL).rstrip('/')]
+
+
+def _ollama_api(endpoint: str, path: str, payload: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Call the Ollama REST API and return the JSON response.
+    
+    Sends a GET request when no payload is given, otherwise POSTs the payload as JSON.
+    """
+    request = urllib.request.Request(
+        f"{endpoint}{path}",
+        data=json.dumps(payload).encode() if payload is not None else None,
+        headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+@functools.lru_cache(maxsize=None)
+def _ollama_tags(endpoint: str) -> Dict[str, Any]:
+    """Get the locally available models from an Ollama server (cached per server)."""
+    return _ollama_api(endpoint, "/api/tags", timeout=5)
+
+
+def _model_digest(model: str, endpoint: str) -> str:
+    """Digest of a model's weights on an Ollama server, or "" if it isn't listed."""
+    for entry in _ollama_tags(endpoint)['models']:
+        if entry['name'] == model:
+            return entry.get('digest', "")
+    return ""
+
+
+def check_prerequisites(endpoints: List[str]):
     """Check if all prerequisites are met."""
     print("🔍 Checking prerequisites...")
     
-    # Check if Ollama is running
-    try:
-        result = subprocess.run(
-            ["curl", "-s", "http://localhost:11434/api/tags"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            print("❌ Ollama is not running. Please start it with: ollama serve")
+    # Check if every Ollama server is running
+    for endpoint in endpoints:
+        try:
+            _ollama_tags(endpoint)
+        except Exception as e:
+            print(f"❌ Ollama is not running at {endpoint} ({e}). Please start it with: ollama serve")
             sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error checking Ollama: {e}")
-        sys.exit(1)
     
     print("✅ All prerequisites met\n")
 
-def get_ollama_models() -> List[str]:
+
+def get_ollama_models(endpoint: str = DEFAULT_OLLAMA_URL) -> List[str]:
     """Get list of available Ollama models."""
     print("📋 Getting list of Ollama models...")
     
     try:
-        result = subprocess.run(
-            ["ollama", "list"],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode != 0:
-            print("❌ Failed to get Ollama models")
-            return []
-        
-        # Parse the output to get model names
-        lines = result.stdout.strip().split('\n')
-        models = []
-        
-        # Skip the header line
-        for line in lines[1:]:
-            if line.strip():
-                # Model name is the first column
-                model_name = line.split()[0]
-                models.append(model_name)
+        models = [model['name'] for model in _ollama_tags(endpoint)['models']]
         
         print(f"✅ Found {len(models)} models: {', '.join(models)}\n")
         return models
@@ -71,25 +103,25 @@ def get_ollama_models() -> List[str]:
         print(f"❌ Error getting models: {e}")
         return []
 
-def load_ollama_model(model: str) -> bool:
+def load_ollama_model(model: str, endpoint: str = DEFAULT_OLLAMA_URL) -> bool:
     """Load an Ollama model, ensuring it's available for use."""
-    print(f"📥 Loading model: {model}...")
+    print(f"📥 Loading model: {model} on {endpoint}...")
     try:
         # First, try to pull the model in case it's not downloaded
-        result = subprocess.run(
-            ["ollama", "pull", model],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0 and "already up to date" not in result.stdout:
-            print(f"⚠️  Warning pulling model: {result.stderr}")
+        try:
+            _ollama_api(endpoint, "/api/pull", {"model": model, "stream": False})
+        except Exception as e:
+            print(f"⚠️  Warning pulling model: {e}")
+        # The pull may have updated the model, so re-read its digest
+        _ollama_tags.cache_clear()
         
-        # Load the model into memory
-        result = subprocess.run(
-            ["ollama", "run", model, "exit"],
-            input="exit\n",
-            capture_output=True,
-            text=True
+        # An empty prompt loads the model into memory without generating,
+        # and keep_alive keeps it resident for the whole comparison run
+        _ollama_api(
+            endpoint,
+            "/api/generate",
+            {"model": model, "prompt": "", "keep_alive": "30m"},
+            timeout=300
         )
         print(f"✅ Model {model} loaded")
         return True
@@ -110,27 +142,83 @@ def unload_ollama_model(model: str):
         print(f"⚠️  Warning unloading model: {e}")
 
 
-def run_multi_demo_for_model(model: str, predict_mode: bool) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=None)
+def _test_suite_hash(test_cases: Tuple[TestCase, ...]) -> str:
+    """Fingerprint of the test cases, tool definitions and prompt version used by a run."""
+    registry = MultiToolRegistry()
+    registry.register_all_tools()
+    suite = {
+        "test_cases": [tc.model_dump() for tc in test_cases],
+        "tools": [tool.model_dump(mode="json") for tool in registry.get_tool_definitions()],
+        "prompt_version": PROMPT_VERSION
+    }
+    return hashlib.sha1(json.dumps(suite, sort_keys=True).encode()).hexdigest()
+
+
+def _cache_file(model: str, predict_mode: bool, endpoint: str = DEFAULT_OLLAMA_URL,
+                test_cases: Optional[Sequence[TestCase]] = None) -> Path:
+    """Path of the cached summary for a model/mode on the given test cases.
+    
+    The key covers everything that changes the scores: the provider and
+    sampling settings, the model's digest (so a re-pulled model is re-run),
+    and the test cases, tools and prompt version, so stale results are never
+    reused. Looking up the digest calls the Ollama server, so this can raise.
+    """
+    if test_cases is None:
+        test_cases = get_multi_tool_test_cases()
+    mode_name = "Predict" if predict_mode else "ChainOfThought"
+    settings = {
+        "model": model,
+        "mode": mode_name,
+        "digest": _model_digest(model, endpoint),
+        "provider": os.getenv("DSPY_PROVIDER", "ollama"),
+        "temperature": os.getenv("LLM_TEMPERATURE"),
+        "max_tokens": os.getenv("LLM_MAX_TOKENS"),
+        "suite": _test_suite_hash(tuple(test_cases))
+    }
+    key = hashlib.sha1(json.dumps(settings, sort_keys=True).encode()).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def run_multi_demo_for_model(model: str, predict_mode: bool, endpoint: str = DEFAULT_OLLAMA_URL,
+                             use_cache: bool = True,
+                             test_cases: Optional[Sequence[TestCase]] = None,
+                             num_threads: int = 1, verbose: bool = True) -> Dict[str, Any]:
     """Run the multi-tool demo for a specific model and capture results.
     
     Args:
         model: The Ollama model name
         predict_mode: If True, use dspy.Predict, else use dspy.ChainOfThought
+        endpoint: URL of the Ollama server that serves the model
+        use_cache: If True, reuse the result of a previous successful run
+        test_cases: Test cases built once for the whole sweep, so every model
+            gets identical prompts. Defaults to the multi-tool test cases.
+        num_threads: Number of test cases to send to the model at once
+        verbose: If True, print each test case and a summary as the run goes
     """
     mode_name = "Predict" if predict_mode else "ChainOfThought"
-    print(f"\n{'='*80}")
-    print(f"🚀 Testing model: {model} (Mode: {mode_name})")
-    print(f"{'='*80}\n")
-    
-    # Set the model in environment
-    os.environ['OLLAMA_MODEL'] = model
-    os.environ['DSPY_DEBUG'] = 'false'  # Disable debug for cleaner output
-    
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
-        # Run the demo directly with predict parameter
-        output_data = run_demo(verbose=True, predict=predict_mode)
+        cache_file = _cache_file(model, predict_mode, endpoint, test_cases)
+        
+        if use_cache and cache_file.exists():
+            print(f"♻️  Using cached results for {model} ({mode_name}) - use --force to re-run")
+            with open(cache_file) as f:
+                cached_results = json.load(f)
+            # The runtime is from the earlier run, not this one
+            cached_results['cached'] = True
+            return cached_results
+        
+        if verbose:
+            print(f"\n{'='*80}")
+            print(f"🚀 Testing model: {model} (Mode: {mode_name})")
+            print(f"{'='*80}\n")
+        
+        # Run the demo directly with the model, server and predict parameter
+        # Debug output is disabled for cleaner output
+        output_data = run_demo(verbose=verbose, predict=predict_mode, model=model, base_url=endpoint,
+                               debug=False, test_cases=test_cases, num_threads=num_threads)
         
         if 'error' in output_data:
             print(f"❌ Error running demo: {output_data['error']}")
@@ -139,7 +227,7 @@ def run_multi_demo_for_model(model: str, predict_mode: bool) -> Dict[str, Any]:
                 'mode': mode_name,
                 'status': 'error',
                 'error': output_data['error'],
-                'runtime': time.time() - start_time
+                'runtime': time.perf_counter() - start_time
             }
         
         summary = output_data['summary']
@@ -148,19 +236,25 @@ def run_multi_demo_for_model(model: str, predict_mode: bool) -> Dict[str, Any]:
             'model': model,
             'mode': mode_name,
             'status': 'success',
-            'runtime': time.time() - start_time,
+            'runtime': time.perf_counter() - start_time,
             'total_tests': summary['total_tests'],
             'perfect_matches': summary['perfect_matches'],
             'perfect_match_pct': (summary['perfect_matches'] / summary['total_tests'] * 100) if summary['total_tests'] > 0 else 0,
             'avg_precision': summary['avg_precision'],
             'avg_recall': summary['avg_recall'],
-            'avg_f1': summary['avg_f1_score']
+            'avg_f1': summary['avg_f1_score'],
+            'cached': False
         }
         
         # Print brief summary
-        print(f"\n📊 Quick Summary for {model} ({mode_name}):")
-        print(f"   Perfect matches: {summary_results['perfect_matches']}/{summary_results['total_tests']} ({summary_results['perfect_match_pct']:.1f}%)")
-        print(f"   F1 Score: {summary_results['avg_f1']:.2f}")
+        if verbose:
+            print(f"\n📊 Quick Summary for {model} ({mode_name}):")
+            print(f"   Perfect matches: {summary_results['perfect_matches']}/{summary_results['total_tests']} ({summary_results['perfect_match_pct']:.1f}%)")
+            print(f"   F1 Score: {summary_results['avg_f1']:.2f}")
+        
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump(summary_results, f)
         
         return summary_results
         
@@ -171,24 +265,127 @@ def run_multi_demo_for_model(model: str, predict_mode: bool) -> Dict[str, Any]:
             'mode': mode_name,
             'status': 'error',
             'error': str(e),
-            'runtime': time.time() - start_time
+            'runtime': time.perf_counter() - start_time
         }
 
 
+def run_model(model: str, endpoint: str, use_cache: bool = True,
+              test_cases: Optional[Sequence[TestCase]] = None,
+              num_threads: int = 1, verbose: bool = True) -> List[Dict[str, Any]]:
+    """Load a model on an Ollama server and run the demo with both modes.
+    
+    Returns:
+        The ChainOfThought and Predict results, or an empty list if the model
+        could not be loaded
+    """
+    # A model whose runs are all cached doesn't need to be loaded. If the cache
+    # can't be checked, load the model anyway and let each run report the error.
+    try:
+        fully_cached = use_cache and all(
+            _cache_file(model, predict_mode, endpoint, test_cases).exists()
+            for predict_mode in (False, True)
+        )
+    except Exception as e:
+        print(f"⚠️  Warning checking cached results for {model}: {e}")
+        fully_cached = False
+    
+    # Load the model before testing
+    if not fully_cached and not load_ollama_model(model, endpoint):
+        print(f"❌ Failed to load {model}, skipping...")
+        return []
+    
+    try:
+        # Run with ChainOfThought (default), then with Predict
+        return [
+            run_multi_demo_for_model(model, predict_mode=predict_mode, endpoint=endpoint,
+                                     use_cache=use_cache, test_cases=test_cases,
+                                     num_threads=num_threads, verbose=verbose)
+            for predict_mode in (False, True)
+        ]
+    finally:
+        # Always unload the model after testing
+        if not fully_cached:
+            unload_ollama_model(model)
+
+
+# Key columns to display (include mode and total_tests) with their display names
+DISPLAY_COLUMNS = {
+    'model': 'model',
+    'mode': 'mode',
+    'status': 'status',
+    'total_tests': 'tests',
+    'perfect_matches': 'perfect',
+    'perfect_match_pct': 'perfect%',
+    'avg_precision': 'precision',
+    'avg_recall': 'recall',
+    'avg_f1': 'F1',
+    'runtime': 'runtime',
+    'cached': 'cached',
+}
+
+
+def _format_cell(column: str, value: Any) -> str:
+    """Format a single result value for the comparison table."""
+    if value is None:
+        return ""
+    if column == 'cached':
+        return "yes" if value else ""
+    if column == 'runtime':
+        return f"{value:.1f}s"
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+def format_result_line(result: Dict[str, Any]) -> str:
+    """Format a one-line summary of a single run."""
+    name = f"{result['model']} ({result['mode']})"
+    if result['status'] != 'success':
+        return f"❌ {name}: {result.get('error', 'failed')}"
+    cached = " (cached)" if result.get('cached') else ""
+    return (f"✅ {name}: F1={result['avg_f1']:.2f}, "
+            f"Perfect={result['perfect_matches']}/{result['total_tests']}, "
+            f"{result['runtime']:.1f}s{cached}")
+
+
+def format_results_table(results: List[Dict[str, Any]]) -> str:
+    """Format the results as a right-aligned text table.
+    
+    Only the columns present in at least one result are shown; failed runs
+    leave their metric cells blank.
+    """
+    columns = [col for col in DISPLAY_COLUMNS if any(col in r for r in results)]
+    rows = [[DISPLAY_COLUMNS[col] for col in columns]]
+    rows.extend([_format_cell(col, r.get(col)) for col in columns] for r in results)
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    return "\n".join(
+        " ".join(cell.rjust(width) for cell, width in zip(row, widths))
+        for row in rows
+    )
+
+
 def main():
     """Main function to run the comparison."""
     parser = argparse.ArgumentParser(description='Run multi-model comparison for DSPy tool selection')
     parser.add_argument('--models', type=str, help='Comma-separated list of models to test')
+    parser.add_argument('--ollama-urls', type=str,
+                        help='Comma-separated Ollama server URLs (e.g. one per GPU); each server tests one model at a time')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-run every model instead of reusing cached results from earlier runs')
+    parser.add_argument('--threads', type=int, default=1,
+                        help='Number of test cases to send to each model at once (default: 1)')
     args = parser.parse_args()
     
     formatter = ConsoleFormatter()
     print(formatter.section_header("🚀 DSPy Multi-Tool Selection - Multi-Model & Mode Comparison"))
     
+    endpoints = get_ollama_endpoints(args.ollama_urls)
+    
     # Check prerequisites
-    check_prerequisites()
+    check_prerequisites(endpoints)
     
-    # Get available models
-    available_models = get_ollama_models()
+    # Get available models (replicated servers share the same model store)
+    available_models = get_ollama_models(endpoints[0])
     
     if not available_models:
         print("❌ No Ollama models found")
@@ -211,113 +408,116 @@ def main():
     
     print(f"\n📊 Testing {len(models_to_test)} models with both Predict and ChainOfThought modes")
     print(f"   Models: {', '.join(models_to_test)}")
+    if len(endpoints) > 1:
+        print(f"   Ollama servers: {', '.join(endpoints)}")
     print(f"   Total tests: {len(models_to_test) * 2} (each model × 2 modes)\n")
     
-    # Run tests for each model with both modes
-    results = []
+    # Create results directory if it doesn't exist
+    RESULTS_DIR.mkdir(exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    # Stream each result to a JSON-lines file as soon as it finishes, so a
+    # crash part-way through the sweep doesn't lose the completed runs
+    jsonl_filename = RESULTS_DIR / f"model_comparison_{timestamp}.jsonl"
+    
+    # Check if models exist in available models
     for model in models_to_test:
-        # Check if model exists in available models
         if model not in available_models:
             print(f"⚠️  Model {model} not found, skipping...")
-            continue
-            
-        # Load the model before testing
-        if not load_ollama_model(model):
-            print(f"❌ Failed to load {model}, skipping...")
-            continue
-        
+    models_to_run = [m for m in models_to_test if m in available_models]
+    
+    # Build the test cases once; every model is sent the same prompts
+    test_cases = get_multi_tool_test_cases()
+    
+    # Each worker borrows a free Ollama server for the duration of a model,
+    # so every server tests one model at a time and the sweep takes roughly
+    # as long as its slowest server instead of the sum of all models
+    free_endpoints: "queue.Queue[str]" = queue.Queue()
+    for endpoint in endpoints:
+        free_endpoints.put(endpoint)
+    
+    # With several servers the models run at the same time and their per-test
+    # output would interleave, so print one line per run as it finishes instead
+    verbose = len(endpoints) == 1
+    
+    def run_model_on_free_endpoint(model: str) -> List[Dict[str, Any]]:
+        endpoint = free_endpoints.get()
         try:
-            # Run with ChainOfThought (default)
-            result_cot = run_multi_demo_for_model(model, predict_mode=False)
-            results.append(result_cot)
-            
-            # Run with Predict
-            result_predict = run_multi_demo_for_model(model, predict_mode=True)
-            results.append(result_predict)
+            return run_model(model, endpoint, use_cache=not args.force, test_cases=test_cases,
+                             num_threads=args.threads, verbose=verbose)
         finally:
-            # Always unload the model after testing
-            unload_ollama_model(model)
+            free_endpoints.put(endpoint)
     
-    # Create DataFrame
-    df = pd.DataFrame(results)
+    # Run tests for each model with both modes
+    results = []
+    max_workers = max(1, min(len(models_to_run), len(endpoints)))
+    with open(jsonl_filename, 'w') as jsonl_file, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_model_on_free_endpoint, model) for model in models_to_run]
+        for future in as_completed(futures):
+            for result in future.result():
+                if not verbose:
+                    print(format_result_line(result))
+                results.append(result)
+                jsonl_file.write(json.dumps(result) + "\n")
+                jsonl_file.flush()
     
-    # Sort by F1 score (best first)
-    if 'avg_f1' in df.columns:
-        df = df.sort_values('avg_f1', ascending=False)
+    # Rank the successful runs by F1 score (best first); failed runs have no
+    # F1 and go last. The ranking is reused for the table, rankings and best model.
+    success_results = sorted(
+        (r for r in results if r['status'] == 'success'), key=itemgetter('avg_f1'), reverse=True
+    )
+    results = success_results + [r for r in results if r['status'] != 'success']
     
     # Display results
     print(formatter.section_header("📊 FINAL MODEL COMPARISON RESULTS"))
     
-    # Display key columns - include mode and total_tests
-    display_columns = ['model', 'mode', 'status', 'total_tests', 'perfect_matches', 'perfect_match_pct', 
-                      'avg_precision', 'avg_recall', 'avg_f1', 'runtime']
-    available_columns = [col for col in display_columns if col in df.columns]
-    
-    # Format the dataframe for display
-    df_display = df[available_columns].copy()
-    if 'runtime' in df_display.columns:
-        df_display['runtime'] = df_display['runtime'].apply(lambda x: f"{x:.1f}s")
-    
-    # Rename columns for better display
-    column_rename = {
-        'total_tests': 'tests',
-        'perfect_matches': 'perfect',
-        'perfect_match_pct': 'perfect%',
-        'avg_precision': 'precision',
-        'avg_recall': 'recall',
-        'avg_f1': 'F1'
-    }
-    df_display = df_display.rename(columns=column_rename)
-    
-    print(df_display.to_string(index=False, float_format='%.2f'))
-    
-    # Create results directory if it doesn't exist
-    results_dir = Path("model_test_results")
-    results_dir.mkdir(exist_ok=True)
+    print(format_results_table(results))
     
     # Save to CSV in the results directory
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    csv_filename = results_dir / f"model_comparison_{timestamp}.csv"
-    df.to_csv(csv_filename, index=False)
+    csv_filename = RESULTS_DIR / f"model_comparison_{timestamp}.csv"
+    # pandas is only needed to write the CSV, so it isn't imported for --help
+    # or when the prerequisites check fails
+    import pandas as pd
+    pd.DataFrame(results).to_csv(csv_filename, index=False)
     print(f"\n💾 Results saved to: {csv_filename}")
+    print(f"   Streamed results: {jsonl_filename}")
     
     # Create a visual summary
-    if 'avg_f1' in df.columns and len(df[df['status'] == 'success']) > 0:
+    if success_results:
         print(formatter.section_header("📈 PERFORMANCE RANKINGS (by F1 Score)"))
         
-        success_df = df[df['status'] == 'success'].copy()
-        for idx, row in success_df.iterrows():
+        for row in success_results:
             # Create a visual bar for F1 score
             bar = formatter.performance_bar(row['avg_f1'])
             
-            mode_display = f"({row['mode']})" if 'mode' in row else ""
+            mode_display = f"({row['mode']})"
             print(f"{row['model']:20} {mode_display:16} {bar} {row['avg_f1']:.2f}")
         
         print(f"\n{formatter.section_separator()}")
-        best_model = success_df.iloc[0]
-        mode_info = f" ({best_model['mode']})" if 'mode' in best_model else ""
-        print(formatter.success_message(f"🏆 Best configuration: {best_model['model']}{mode_info}"))
+        best_model = success_results[0]
+        print(formatter.success_message(f"🏆 Best configuration: {best_model['model']} ({best_model['mode']})"))
         print(f"   - F1 Score: {best_model['avg_f1']:.2f}")
         print(f"   - Precision: {best_model['avg_precision']:.2f}")
         print(f"   - Recall: {best_model['avg_recall']:.2f}")
-        print(f"   - Perfect matches: {int(best_model['perfect_matches'])}/{int(best_model['total_tests'])} ({best_model['perfect_match_pct']:.1f}%)")
-        print(f"   - Runtime: {best_model['runtime']:.1f}s")
+        print(f"   - Perfect matches: {best_model['perfect_matches']}/{best_model['total_tests']} ({best_model['perfect_match_pct']:.1f}%)")
+        print(f"   - Runtime: {best_model['runtime']:.1f}s{' (cached)' if best_model.get('cached') else ''}")
         
         # Compare modes for each model
         print(formatter.section_header("📊 MODE COMPARISON BY MODEL"))
         
-        # Get unique models that were actually tested
-        tested_models = success_df['model'].unique()
+        # Group the successful runs by model, keeping ranking order
+        results_by_model: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for row in success_results:
+            results_by_model.setdefault(row['model'], {})[row['mode']] = row
         
-        for model in tested_models:
-            model_results = success_df[success_df['model'] == model]
+        for model, model_results in results_by_model.items():
             if len(model_results) == 2:
-                cot_result = model_results[model_results['mode'] == 'ChainOfThought'].iloc[0]
-                pred_result = model_results[model_results['mode'] == 'Predict'].iloc[0]
+                cot_result = model_results['ChainOfThought']
+                pred_result = model_results['Predict']
                 
                 print(f"{model}:")
-                print(f"   ChainOfThought: F1={cot_result['avg_f1']:.2f}, Perfect={int(cot_result['perfect_matches'])}/{int(cot_result['total_tests'])}")
-                print(f"   Predict:        F1={pred_result['avg_f1']:.2f}, Perfect={int(pred_result['perfect_matches'])}/{int(pred_result['total_tests'])}")
+                print(f"   ChainOfThought: F1={cot_result['avg_f1']:.2f}, Perfect={cot_result['perfect_matches']}/{cot_result['total_tests']}")
+                print(f"   Predict:        F1={pred_result['avg_f1']:.2f}, Perfect={pred_result['perfect_matches']}/{pred_result['total_tests']}")
                 
                 # Show which mode is better
                 if cot_result['avg_f1'] > pred_result['avg_f1']:
@@ -1,12 +1,19 @@
-"""Test case definitions for tool selection evaluation."""
+"""Test case definitions for tool selection evaluation.
 
-from typing import List
+Each set is built once and shared. TestCase is frozen and keeps its
+expected tools in a tuple, so one caller can't change a test case under
+another.
+"""
+
+import functools
+from typing import Tuple
 from shared_utils.models import TestCase
 
 
-def get_default_test_cases() -> List[TestCase]:
+@functools.lru_cache(maxsize=None)
+def get_default_test_cases() -> Tuple[TestCase, ...]:
     """Get the default set of test cases for tool selection evaluation."""
-    return [
+    return (
         TestCase(
             request="I'm stuck on the treasure hunt. Can you help?",
             expected_tools=["give_hint"],
@@ -62,12 +69,13 @@ def get_default_test_cases() -> List[TestCase]:
             expected_tools=["guess_location"],
             description="Explicit final guess"
         ),
-    ]
+    )
 
 
-def get_multi_tool_test_cases() -> List[TestCase]:
+@functools.lru_cache(maxsize=None)
+def get_multi_tool_test_cases() -> Tuple[TestCase, ...]:
     """Get test cases for multi-tool selection evaluation (14 tools)."""
-    return [
+    return (
         TestCase(
             request="What's the weather like today?",
             expected_tools=["get_weather"],
@@ -123,4 +131,4 @@ def get_multi_tool_test_cases() -> List[TestCase]:
             expected_tools=["check_balance", "invest"],
             description="Investment planning"
         )
-    ]
\ No newline at end of file
+    )
\ No newline at end of file
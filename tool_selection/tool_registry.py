@@ -1,6 +1,7 @@
 """Multi-tool registry with multiple domain-specific tools for testing LLM tool selection."""
 
 import sys
+import functools
 from pathlib import Path
 from typing import List, Dict, Callable, Any
 
@@ -15,22 +16,39 @@ class MultiToolRegistry:
     def __init__(self):
         self._tools: Dict[MultiToolName, MultiTool] = {}
         self._functions: Dict[MultiToolName, Callable] = {}
+        self._definitions: tuple[MultiTool, ...] | None = None
+        self._names: tuple[str, ...] | None = None
         
     def register(self, tool: MultiTool, func: Callable):
         """Register a tool with its schema and function."""
         self._tools[tool.name] = tool
         self._functions[tool.name] = func
+        self._definitions = None
+        self._names = None
         
-    def get_tool_definitions(self) -> List[MultiTool]:
-        """Get all tool schemas."""
-        return list(self._tools.values())
+    def get_tool_definitions(self) -> tuple[MultiTool, ...]:
+        """Get all tool schemas.
+        
+        The same tuple is returned until another tool is registered, so
+        callers can hold on to it without copying.
+        """
+        if self._definitions is None:
+            self._definitions = tuple(self._tools.values())
+        return self._definitions
         
     def get_tool_names(self) -> tuple[str, ...]:
         """Get all registered tool names."""
-        return tuple(tool.name.value for tool in self._tools.values())
+        if self._names is None:
+            self._names = tuple(name.value for name in self._tools)
+        return self._names
         
     def execute(self, decision: MultiToolDecision) -> List[dict]:
-        """Execute multiple tools based on the decision."""
+        """Execute multiple tools based on the decision.
+        
+        Every call runs, including repeats: tools like transfer_money or
+        add_to_cart have side effects, so an identical second call is not a
+        no-op.
+        """
         results = []
         
         for tool_call in decision.tool_calls:
@@ -44,15 +62,14 @@ class MultiToolRegistry:
                 })
                 continue
             
-            if tool_name not in self._functions:
+            tool_func = self._functions.get(tool_name)
+            if tool_func is None:
                 results.append({
                     "error": f"Tool '{tool_name.value}' not found in registry.",
                     "tool": tool_name.value
                 })
                 continue
                 
-            tool_func = self._functions[tool_name]
-            
             try:
                 result = tool_func(tool_call.arguments)
                 results.append({
@@ -69,9 +86,19 @@ class MultiToolRegistry:
         
     def register_all_tools(self):
         """Register all multi-domain tools for testing."""
-        
+        for tool, func in _all_tools():
+            self.register(tool, func)
+
+
+@functools.lru_cache(maxsize=None)
+def _all_tools() -> tuple[tuple[MultiTool, Callable], ...]:
+    """Build the (tool, function) pairs for every multi-domain tool once.
+    
+    The tool models are frozen, so every registry can share the same instances.
+    """
+    return (
         # Events tools
-        self.register(
+        (
             MultiTool(
                 name=MultiToolName.FIND_EVENTS,
                 description="Find events based on location, date, or type",
@@ -83,9 +110,9 @@ class MultiToolRegistry:
                 category="events"
             ),
             lambda args: {"events": f"Found 5 events in {args.get('location', 'your area')}"}
-        )
-        
-        self.register(
+        ),
+
+        (
             MultiTool(
                 name=MultiToolName.CREATE_EVENT,
                 description="Create a new event",
@@ -97,9 +124,9 @@ class MultiToolRegistry:
                 category="events"
             ),
             lambda args: {"event_id": "EVT123", "status": "created"}
-        )
-        
-        self.register(
+        ),
+
+        (
             MultiTool(
                 name=MultiToolName.CANCEL_EVENT,
                 description="Cancel an existing event or reservation",
@@ -110,10 +137,10 @@ class MultiToolRegistry:
                 category="events"
             ),
             lambda args: {"status": "cancelled", "event_id": args.get("event_id", "unknown")}
-        )
-        
+        ),
+
         # E-commerce tools
-        self.register(
+        (
             MultiTool(
                 name=MultiToolName.SEARCH_PRODUCTS,
                 description="Search for products in the catalog",
@@ -125,9 +152,9 @@ class MultiToolRegistry:
                 category="ecommerce"
             ),
             lambda args: {"products": f"Found 10 products matching '{args.get('query', 'your search')}'"}
-        )
-        
-        self.register(
+        ),
+
+        (
             MultiTool(
                 name=MultiToolName.ADD_TO_CART,
                 description="Add a product to the shopping cart",
@@ -138,9 +165,9 @@ class MultiToolRegistry:
                 category="ecommerce"
             ),
             lambda args: {"cart_total": 2, "added": args.get("product_id", "PROD123")}
-        )
-        
-        self.register(
+        ),
+
+        (
             MultiTool(
                 name=MultiToolName.TRACK_ORDER,
                 description="Track the status of an order",
@@ -150,9 +177,9 @@ class MultiToolRegistry:
                 category="ecommerce"
             ),
             lambda args: {"status": "In transit", "delivery_date": "Tomorrow"}
-        )
-        
-        self.register(
+        ),
+
+        (
             MultiTool(
                 name=MultiToolName.RETURN_ITEM,
                 description="Return an item for refund or exchange",
@@ -164,10 +191,10 @@ class MultiToolRegistry:
                 category="ecommerce"
             ),
             lambda args: {"return_id": "RET456", "status": "processing", "refund_amount": "$99.99"}
-        )
-        
+        ),
+
         # Finance tools
-        self.register(
+        (
             MultiTool(
                 name=MultiToolName.CHECK_BALANCE,
                 description="Check account balance",
@@ -177,9 +204,9 @@ class MultiToolRegistry:
                 category="finance"
             ),
             lambda args: {"balance": "$1,234.56", "account": args.get("account_type", "checking")}
-        )
-        
-        self.register(
+        ),
+
+        (
             MultiTool(
                 name=MultiToolName.TRANSFER_MONEY,
                 description="Transfer money between accounts or to another person",
@@ -191,9 +218,9 @@ class MultiToolRegistry:
                 category="finance"
             ),
             lambda args: {"transaction_id": "TXN456", "status": "completed"}
-        )
-        
-        self.register(
+        ),
+
+        (
             MultiTool(
                 name=MultiToolName.PAY_BILL,
                 description="Pay a bill",
@@ -205,9 +232,9 @@ class MultiToolRegistry:
                 category="finance"
             ),
             lambda args: {"confirmation": f"Paid ${args.get('amount', 0)} to {args.get('biller', 'biller')}"}
-        )
-        
-        self.register(
+        ),
+
+        (
             MultiTool(
                 name=MultiToolName.GET_STATEMENT,
                 description="Get account statement",
@@ -218,9 +245,9 @@ class MultiToolRegistry:
                 category="finance"
             ),
             lambda args: {"transactions": 42, "period": args.get("period", "last month")}
-        )
-        
-        self.register(
+        ),
+
+        (
             MultiTool(
                 name=MultiToolName.INVEST,
                 description="Invest money in stocks, bonds, or funds",
@@ -231,4 +258,5 @@ class MultiToolRegistry:
                 category="finance"
             ),
             lambda args: {"investment_id": "INV789", "amount": args.get("amount", 0), "type": args.get("investment_type", "stocks")}
-        )
\ No newline at end of file
+        )
+    )
@@ -4,16 +4,17 @@ from typing import Dict, Any
 from ..validators import validate_args, required_string
 
 
+# Define validation rules
+_VALIDATORS = (
+    required_string("order_id", error_message="Order ID is required"),
+)
+
+
 # this is made to demonstrate functionality but it could just as durably be an API call
 # called as part of a temporal activity with automatic retries
 def get_order(args: Dict[str, Any]) -> Dict[str, Any]:
-    # Define validation rules
-    validators = [
-        required_string("order_id", error_message="Order ID is required")
-    ]
-    
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _VALIDATORS)
     if "error" in validated:
         return validated
     
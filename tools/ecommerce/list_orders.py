@@ -8,14 +8,15 @@ def sorting(e):
     return e["order_date"]
 
 
+# Define validation rules
+_VALIDATORS = (
+    required_email("email_address"),
+)
+
+
 def list_orders(args: Dict[str, Any]) -> Dict[str, Any]:
-    # Define validation rules
-    validators = [
-        required_email("email_address")
-    ]
-    
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _VALIDATORS)
     if "error" in validated:
         return validated
     
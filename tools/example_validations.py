@@ -14,25 +14,26 @@ from .validators import (
 )
 
 
+# Define validation rules
+_FIND_EVENTS_VALIDATORS = (
+    optional_string("city"),
+    FieldValidator(
+        "month", 
+        FieldType.STRING, 
+        required=True,
+        custom_validator=lambda m: m.capitalize() in [
+            "January", "February", "March", "April", "May", "June",
+            "July", "August", "September", "October", "November", "December"
+        ],
+        error_message="Invalid month. Please provide a valid month name (e.g., 'January')"
+    ),
+)
+
+
 def find_events_validated(args: Dict[str, Any]) -> Dict[str, Any]:
     """Example: find_events with validation"""
-    # Define validation rules
-    validators = [
-        optional_string("city"),
-        FieldValidator(
-            "month", 
-            FieldType.STRING, 
-            required=True,
-            custom_validator=lambda m: m.capitalize() in [
-                "January", "February", "March", "April", "May", "June",
-                "July", "August", "September", "October", "November", "December"
-            ],
-            error_message="Invalid month. Please provide a valid month name (e.g., 'January')"
-        )
-    ]
-    
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _FIND_EVENTS_VALIDATORS)
     if "error" in validated:
         return validated
     
@@ -43,17 +44,18 @@ def find_events_validated(args: Dict[str, Any]) -> Dict[str, Any]:
     # ... rest of the implementation
 
 
+# Define validation rules with custom validators
+_BOOK_PTO_VALIDATORS = (
+    required_email("email"),
+    required_date("start_date"),
+    required_date("end_date"),
+)
+
+
 def book_pto_validated(args: Dict[str, Any]) -> Dict[str, Any]:
     """Example: book_pto with validation"""
-    # Define validation rules with custom validators
-    validators = [
-        required_email("email"),
-        required_date("start_date"),
-        required_date("end_date"),
-    ]
-    
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _BOOK_PTO_VALIDATORS)
     if "error" in validated:
         return validated
     
@@ -69,66 +71,68 @@ def book_pto_validated(args: Dict[str, Any]) -> Dict[str, Any]:
     # ... rest of the implementation
 
 
+_GET_ACCOUNT_BALANCE_VALIDATORS = (
+    FieldValidator(
+        "account_id",
+        FieldType.STRING,
+        required=True,
+        min_length=5,
+        max_length=20,
+        error_message="Account ID must be between 5 and 20 characters"
+    ),
+    FieldValidator(
+        "account_type",
+        FieldType.ENUM,
+        required=False,
+        default="checking",
+        allowed_values=["checking", "savings", "investment"],
+        error_message="Account type must be 'checking', 'savings', or 'investment'"
+    ),
+)
+
+
 def get_account_balance_validated(args: Dict[str, Any]) -> Dict[str, Any]:
     """Example: account balance with enum validation"""
-    validators = [
-        FieldValidator(
-            "account_id",
-            FieldType.STRING,
-            required=True,
-            min_length=5,
-            max_length=20,
-            error_message="Account ID must be between 5 and 20 characters"
-        ),
-        FieldValidator(
-            "account_type",
-            FieldType.ENUM,
-            required=False,
-            default="checking",
-            allowed_values=["checking", "savings", "investment"],
-            error_message="Account type must be 'checking', 'savings', or 'investment'"
-        )
-    ]
-    
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _GET_ACCOUNT_BALANCE_VALIDATORS)
     if "error" in validated:
         return validated
     
     # ... rest of the implementation
 
 
+_SEARCH_PRODUCTS_VALIDATORS = (
+    optional_string("query"),
+    FieldValidator(
+        "min_price",
+        FieldType.FLOAT,
+        required=False,
+        default=0.0,
+        min_value=0.0,
+        error_message="Minimum price must be non-negative"
+    ),
+    FieldValidator(
+        "max_price",
+        FieldType.FLOAT,
+        required=False,
+        default=999999.99,
+        min_value=0.0,
+        error_message="Maximum price must be non-negative"
+    ),
+    FieldValidator(
+        "limit",
+        FieldType.INTEGER,
+        required=False,
+        default=10,
+        min_value=1,
+        max_value=100,
+        error_message="Limit must be between 1 and 100"
+    ),
+)
+
+
 def search_products_validated(args: Dict[str, Any]) -> Dict[str, Any]:
     """Example: search with numeric constraints"""
-    validators = [
-        optional_string("query"),
-        FieldValidator(
-            "min_price",
-            FieldType.FLOAT,
-            required=False,
-            default=0.0,
-            min_value=0.0,
-            error_message="Minimum price must be non-negative"
-        ),
-        FieldValidator(
-            "max_price",
-            FieldType.FLOAT,
-            required=False,
-            default=999999.99,
-            min_value=0.0,
-            error_message="Maximum price must be non-negative"
-        ),
-        FieldValidator(
-            "limit",
-            FieldType.INTEGER,
-            required=False,
-            default=10,
-            min_value=1,
-            max_value=100,
-            error_message="Limit must be between 1 and 100"
-        )
-    ]
-    
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _SEARCH_PRODUCTS_VALIDATORS)
     if "error" in validated:
         return validated
     
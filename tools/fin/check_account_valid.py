@@ -4,22 +4,23 @@ from typing import Dict, Any
 from ..validators import validate_args, optional_string, FieldValidator, FieldType
 
 
+# Define validation rules - at least one of email or account_id is required
+_VALIDATORS = (
+    FieldValidator(
+        "email",
+        FieldType.EMAIL,
+        required=False,
+        default=""
+    ),
+    optional_string("account_id"),
+)
+
+
 # this is made to demonstrate functionality but it could just as durably be an API call
 # called as part of a temporal activity with automatic retries
 def check_account_valid(args: Dict[str, Any]) -> Dict[str, Any]:
-    # Define validation rules - at least one of email or account_id is required
-    validators = [
-        FieldValidator(
-            "email",
-            FieldType.EMAIL,
-            required=False,
-            default=""
-        ),
-        optional_string("account_id")
-    ]
-    
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _VALIDATORS)
     if "error" in validated:
         return validated
     
@@ -4,19 +4,20 @@ from typing import Dict, Any
 from ..validators import validate_args, required_string
 
 
+# Define validation rules
+_VALIDATORS = (
+    required_string(
+        "email_address_or_account_ID",
+        error_message="Please provide an email address or account ID"
+    ),
+)
+
+
 # this is made to demonstrate functionality but it could just as durably be an API call
 # this assumes it's a valid account - use check_account_valid() to verify that first
 def get_account_balance(args: Dict[str, Any]) -> Dict[str, Any]:
-    # Define validation rules
-    validators = [
-        required_string(
-            "email_address_or_account_ID",
-            error_message="Please provide an email address or account ID"
-        )
-    ]
-    
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _VALIDATORS)
     if "error" in validated:
         return validated
     
@@ -5,25 +5,26 @@ from typing import Dict, Any
 from .validators import validate_args, optional_string, FieldValidator, FieldType
 
 
+# Define validation rules
+_VALIDATORS = (
+    optional_string("city"),
+    FieldValidator(
+        "month",
+        FieldType.STRING,
+        required=False,
+        default="",
+        custom_validator=lambda m: not m or m.capitalize() in [
+            "January", "February", "March", "April", "May", "June",
+            "July", "August", "September", "October", "November", "December"
+        ],
+        error_message="Invalid month. Please provide a valid month name (e.g., 'January')"
+    ),
+)
+
+
 def find_events(args: Dict[str, Any]) -> Dict[str, Any]:
-    # Define validation rules
-    validators = [
-        optional_string("city"),
-        FieldValidator(
-            "month",
-            FieldType.STRING,
-            required=False,
-            default="",
-            custom_validator=lambda m: not m or m.capitalize() in [
-                "January", "February", "March", "April", "May", "June",
-                "July", "August", "September", "October", "November", "December"
-            ],
-            error_message="Invalid month. Please provide a valid month name (e.g., 'January')"
-        )
-    ]
-    
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _VALIDATORS)
     if "error" in validated:
         return validated
     
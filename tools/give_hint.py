@@ -1,18 +1,20 @@
 from typing import Dict, Any
 from .validators import validate_args, optional_int
 
+
+# Define validation rules
+_VALIDATORS = (
+    optional_int("hint_total", default=0, min_value=0),
+)
+
+
 def give_hint(args: Dict[str, Any]) -> Dict[str, str]:
     """
     Give a hint about the treasure location.
     Uses common validation pattern.
     """
-    # Define validation rules
-    validators = [
-        optional_int("hint_total", default=0, min_value=0)
-    ]
-    
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _VALIDATORS)
     if "error" in validated:
         return validated
     
@@ -1,17 +1,19 @@
 from typing import Dict, Any
 from .validators import validate_args, optional_string
 
+
+# Define validation rules
+_VALIDATORS = (
+    optional_string("address"),
+    optional_string("city"),
+    optional_string("state"),
+)
+
+
 def guess_location(args: Dict[str, Any]) -> Dict[str, str]:
     """Guess the treasure location."""
-    # Define validation rules
-    validators = [
-        optional_string("address"),
-        optional_string("city"),
-        optional_string("state")
-    ]
-    
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _VALIDATORS)
     if "error" in validated:
         return validated
     
@@ -1,16 +1,18 @@
 from typing import Dict, Any
 from ..validators import validate_args, required_email, required_date
 
+
+# Define validation rules
+_VALIDATORS = (
+    required_email("email"),
+    required_date("start_date"),
+    required_date("end_date"),
+)
+
+
 def book_pto(args: Dict[str, Any]) -> Dict[str, Any]:
-    # Define validation rules
-    validators = [
-        required_email("email"),
-        required_date("start_date"),
-        required_date("end_date")
-    ]
-    
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _VALIDATORS)
     if "error" in validated:
         return validated
     
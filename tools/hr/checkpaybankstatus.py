@@ -1,14 +1,16 @@
 from typing import Dict, Any
 from ..validators import validate_args, required_email
 
+
+# Define validation rules
+_VALIDATORS = (
+    required_email("email"),
+)
+
+
 def checkpaybankstatus(args: Dict[str, Any]) -> Dict[str, Any]:
-    # Define validation rules
-    validators = [
-        required_email("email")
-    ]
-    
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _VALIDATORS)
     if "error" in validated:
         return validated
     
@@ -4,14 +4,15 @@ from typing import Dict, Any
 from ..validators import validate_args, required_email
 
 
+# Define validation rules
+_VALIDATORS = (
+    required_email("email"),
+)
+
+
 def current_pto(args: Dict[str, Any]) -> Dict[str, Any]:
-    # Define validation rules
-    validators = [
-        required_email("email")
-    ]
-    
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _VALIDATORS)
     if "error" in validated:
         return validated
     
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Optional, Union, Callable
+from typing import Dict, Any, List, Optional, Sequence, Union, Callable
 from datetime import datetime
 from enum import Enum
 
@@ -49,13 +49,13 @@ class FieldValidator:
         self.error_message = error_message
 
 
-def validate_args(args: Dict[str, Any], validators: List[FieldValidator]) -> Dict[str, Any]:
+def validate_args(args: Dict[str, Any], validators: Sequence[FieldValidator]) -> Dict[str, Any]:
     """
     Validate and parse arguments according to field validators.
     
     Args:
         args: Raw arguments dictionary
-        validators: List of FieldValidator configurations
+        validators: FieldValidator configurations (a tuple for shared module-level rules)
         
     Returns:
         Dict with validated and parsed values